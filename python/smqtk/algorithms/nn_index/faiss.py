@@ -674,9 +674,10 @@ class FaissNearestNeighborsIndex (NearestNeighborsIndex):
         :rtype: (np.ndarray, list[collections.abc.Hashable])
         """
         new_uuids = [desc.uuid() for desc in descriptors]
+        # Only cast (copy) when the stacked vectors are not already float32.
         data = np.vstack(
             DescriptorElement.get_many_vectors(descriptors)
-        ).astype(np.float32)
+        ).astype(np.float32, copy=False)
         self._log.info("data shape, type: %s, %s",
                        data.shape, data.dtype)
         self._log.info("# uuids: %d", len(new_uuids))
@@ -758,7 +759,7 @@ class FaissNearestNeighborsIndex (NearestNeighborsIndex):
 
         """
         log = self._log
-        q = d.vector()[np.newaxis, :].astype(np.float32)
+        q = d.vector()[np.newaxis, :].astype(np.float32, copy=False)
         log.debug("Received query for %d nearest neighbors", n)
 
         with self._model_lock:
@@ -1,4 +1,3 @@
-import heapq
 import threading
 
 from six import BytesIO
@@ -18,7 +17,7 @@ from smqtk.utils.configuration import (
     to_config_dict
 )
 from smqtk.utils.dict import merge_dict
-from smqtk.utils.metrics import hamming_distance
+from smqtk.utils.metrics import hamming_distance_packed
 
 
 class LinearHashIndex (HashIndex):
@@ -99,12 +98,31 @@ class LinearHashIndex (HashIndex):
         """
         super(LinearHashIndex, self).__init__()
         self.cache_element = cache_element
+        # Cached list of indexed codes and the matching matrix of those codes
+        # packed into bytes, built on demand by ``_get_packed_index``.
+        #: :type: None | (int, list[int], numpy.ndarray[numpy.uint8])
+        self._packed_index = None
         # Our index is the set of bit-vectors as an integers/longs.
         #: :type: set[int]
         self.index = set()
         self._model_lock = threading.RLock()
         self.load_cache()
 
+    @property
+    def index(self):
+        """
+        :return: Set of indexed hash codes as integers. This set should not be
+            modified in-place outside of this class; assign a new set
+            instead.
+        :rtype: set[int]
+        """
+        return self._index
+
+    @index.setter
+    def index(self, codes):
+        self._index = codes
+        self._packed_index = None
+
     def get_config(self):
         c = self.get_default_config()
         if self.cache_element:
@@ -172,7 +190,8 @@ class LinearHashIndex (HashIndex):
 
         """
         with self._model_lock:
-            self.index.update(set(map(bit_vector_to_int_large, hashes)))
+            self._index.update(map(bit_vector_to_int_large, hashes))
+            self._packed_index = None
             self.save_cache()
 
     def _remove_from_index(self, hashes):
@@ -197,6 +216,31 @@ class LinearHashIndex (HashIndex):
             self.index = self.index - h_int_set
             self.save_cache()
 
+    def _get_packed_index(self, n_bytes):
+        """
+        Get the indexed codes as a list, along with a matrix of those codes
+        packed into ``n_bytes`` big-endian bytes each, one code per row.
+
+        This is cached until the index is next assigned or ``n_bytes``
+        changes.
+
+        :param n_bytes: Number of bytes to pack each code into.
+        :type n_bytes: int
+
+        :return: List of codes and the matching packed code matrix.
+        :rtype: (list[int], numpy.ndarray[numpy.uint8])
+
+        """
+        if self._packed_index is None or self._packed_index[0] != n_bytes:
+            # Codes loaded from cache may be numpy integers.
+            codes = [int(c) for c in self.index]
+            packed = numpy.frombuffer(
+                b''.join(c.to_bytes(n_bytes, 'big') for c in codes),
+                dtype=numpy.uint8
+            ).reshape(len(codes), n_bytes)
+            self._packed_index = (n_bytes, codes, packed)
+        return self._packed_index[1:]
+
     def _nn(self, h, n=1):
         """
         Internal method to be implemented by sub-classes to return the nearest
@@ -223,14 +267,16 @@ class LinearHashIndex (HashIndex):
 
         """
         with self._model_lock:
-            h_int = bit_vector_to_int_large(h)
             bits = len(h)
-            #: :type: list[int|long]
-            near_codes = \
-                heapq.nsmallest(n, self.index,
-                                lambda e: hamming_distance(h_int, e)
-                                )
-            distances = map(hamming_distance, near_codes,
-                            [h_int] * len(near_codes))
-            return [int_to_bit_vector_large(c, bits) for c in near_codes], \
-                   [d / float(bits) for d in distances]
+            n_bytes = (bits + 7) // 8
+            codes, packed = self._get_packed_index(n_bytes)
+            h_packed = numpy.frombuffer(
+                bit_vector_to_int_large(h).to_bytes(n_bytes, 'big'),
+                dtype=numpy.uint8
+            )
+            distances = hamming_distance_packed(h_packed, packed)
+            # Stable sort so that ties keep index iteration order.
+            near_idxs = numpy.argsort(distances, kind='stable')[:n]
+            return [int_to_bit_vector_large(codes[i], bits)
+                    for i in near_idxs], \
+                   [distances[i] / float(bits) for i in near_idxs]
@@ -7,6 +7,7 @@ References/Resources:
 """
 from collections.abc import Sequence
 from copy import deepcopy
+import itertools
 import logging
 
 import numpy
@@ -297,32 +298,55 @@ class ItqFunctor (LshFunctor):
 
         return b, r
 
-    def fit(self, descriptors, use_multiprocessing=True):
+    def _check_n_features(self, n_features):
         """
-        Fit the ITQ model given the input set of descriptors.
+        Check that descriptors of the given dimensionality can produce hash
+        codes of the configured bit length.
 
-        :param descriptors: Iterable of ``DescriptorElement`` vectors to fit
-            the model to.
-        :type descriptors:
-            collections.abc.Iterable[smqtk.representation.DescriptorElement]
+        :param n_features: Number of features in input descriptors.
+        :type n_features: int
 
-        :param use_multiprocessing: If multiprocessing should be used, as
-            opposed to threading, when collecting descriptor elements from the
-            given iterable.
-        :type use_multiprocessing: bool
+        :raises ValueError: Descriptors have fewer features than the
+            configured bit length.
 
-        :raises RuntimeError: There is already a model loaded
-
-        :return: Matrix hash codes for provided descriptors in order.
-        :rtype: numpy.ndarray[bool]
+        """
+        if n_features < self.bit_length:
+            raise ValueError("Input descriptors have fewer features than "
+                             "requested bit encoding. Hash codes will be "
+                             "smaller than requested due to PCA decomposition "
+                             "result being bound by number of features.")
 
+    def _descriptors_to_matrix(self, descriptors, use_multiprocessing,
+                               n_hint, procs):
         """
-        if self.has_model():
-            raise RuntimeError("Model components have already been loaded.")
+        Create a matrix of the vectors of the given descriptor elements.
 
+        See ``fit`` for parameter details.
+
+        :return: Matrix of descriptor vectors, one per row.
+        :rtype: numpy.ndarray
+
+        """
         dbg_report_interval = 1.0
         dbg_report = self.get_logger().getEffectiveLevel() <= logging.DEBUG
-        if not isinstance(descriptors, Sequence):
+        x = None
+        n_yielded = 0
+        if isinstance(descriptors, Sequence):
+            sample = descriptors[0]
+        elif n_hint is not None:
+            d_iter = iter(descriptors)
+            try:
+                sample = next(d_iter)
+            except StopIteration:
+                raise ValueError("No descriptors given to fit on.")
+
+            def counted_descriptors():
+                nonlocal n_yielded
+                for _d in itertools.chain([sample], d_iter):
+                    n_yielded += 1
+                    yield _d
+            descriptors = counted_descriptors()
+        else:
             self._log.info("Creating sequence from iterable")
             descriptors_l = []
             pr = ProgressReporter(self._log.debug, dbg_report_interval).start()
@@ -331,16 +355,95 @@ class ItqFunctor (LshFunctor):
                 dbg_report and pr.increment_report()
             dbg_report and pr.report()
             descriptors = descriptors_l
-        if len(descriptors[0].vector()) < self.bit_length:
-            raise ValueError("Input descriptors have fewer features than "
-                             "requested bit encoding. Hash codes will be "
-                             "smaller than requested due to PCA decomposition "
-                             "result being bound by number of features.")
+            sample = descriptors[0]
+        sample_v = sample.vector()
+        self._check_n_features(sample_v.size)
+        preallocate = not isinstance(descriptors, Sequence)
+        if preallocate:
+            self._log.info("Pre-allocating matrix for %d descriptors", n_hint)
+            x = numpy.ndarray((n_hint, sample_v.size), sample_v.dtype)
 
         self._log.info("Creating matrix of descriptors for fitting")
-        x = elements_to_matrix(descriptors,
+        x = elements_to_matrix(descriptors, mat=x, procs=procs,
                                report_interval=dbg_report_interval,
                                use_multiprocessing=use_multiprocessing)
+        # Filling a pre-allocated matrix stops after ``n_hint`` rows, pulling
+        # one extra descriptor only when more than that are available.
+        if preallocate and n_yielded < n_hint:
+            self._log.warning("Only %d of the hinted %d descriptors were "
+                              "yielded.", n_yielded, n_hint)
+            x = x[:n_yielded]
+        elif preallocate and n_yielded > n_hint:
+            self._log.warning("More than the hinted %d descriptors are "
+                              "available. Only using the first %d.",
+                              n_hint, n_hint)
+        return x
+
+    def fit(self, descriptors, use_multiprocessing=True, n_hint=None,
+            procs=None):
+        """
+        Fit the ITQ model given the input set of descriptors.
+
+        :param descriptors: Iterable of ``DescriptorElement`` vectors to fit
+            the model to, or a 2-dimensional matrix of descriptor vectors, one
+            per row. A given matrix is not modified. It is copied into a
+            floating-point type of at least single precision for fitting.
+        :type descriptors:
+            collections.abc.Iterable[smqtk.representation.DescriptorElement] |
+            numpy.ndarray
+
+        :param use_multiprocessing: If multiprocessing should be used, as
+            opposed to threading, when collecting descriptor elements from the
+            given iterable. This is ignored when ``descriptors`` is a matrix.
+        :type use_multiprocessing: bool
+
+        :param n_hint: Optional expected number of descriptors yielded by a
+            non-sequence ``descriptors`` iterable. When provided, the
+            descriptor matrix is allocated up-front and filled directly from
+            the iterable instead of first collecting elements into a list. If
+            fewer descriptors are yielded, the matrix is truncated to those
+            yielded. If more are available, only the first ``n_hint`` are
+            used. This is ignored when ``descriptors`` is a sequence or a
+            matrix.
+        :type n_hint: None | int
+
+        :param procs: Optional number of threads/processes to use when
+            collecting descriptor vectors from the given iterable. If None,
+            all available cores are used. This is ignored when
+            ``descriptors`` is a matrix.
+        :type procs: None | int
+
+        :raises RuntimeError: There is already a model loaded
+        :raises ValueError: A given descriptor matrix is not 2-dimensional or
+            has no rows, descriptors have fewer features than the configured
+            bit length,
+            ``n_hint`` is less than 1 or an iterable given with ``n_hint``
+            yielded no descriptors.
+
+        :return: Matrix hash codes for provided descriptors in order.
+        :rtype: numpy.ndarray[bool]
+
+        """
+        if self.has_model():
+            raise RuntimeError("Model components have already been loaded.")
+        if n_hint is not None and n_hint < 1:
+            raise ValueError("Descriptor count hint must be at least 1 "
+                             "(given %d)." % n_hint)
+
+        if isinstance(descriptors, numpy.ndarray):
+            if descriptors.ndim != 2:
+                raise ValueError("Descriptor matrix must be 2-dimensional "
+                                 "(given %d dimensions)." % descriptors.ndim)
+            if descriptors.shape[0] == 0:
+                raise ValueError("No descriptors given to fit on.")
+            self._check_n_features(descriptors.shape[1])
+            # Centering below is in-place, so work on a floating-point copy.
+            x = numpy.array(descriptors, dtype=numpy.result_type(
+                descriptors.dtype, numpy.float32
+            ))
+        else:
+            x = self._descriptors_to_matrix(descriptors, use_multiprocessing,
+                                            n_hint, procs)
         self._log.debug("descriptor matrix shape: %s", x.shape)
 
         self._log.debug("Info normalizing descriptors by factor: %s",
@@ -9,13 +9,25 @@ The ``uuids_list_filepath`` configuration property is optional and should
 be used to specify a sub-set of descriptors in the configured set to
 train on. This only works if the stored descriptors' UUID is a type of
 string.
+
+Descriptor vectors are loaded using threads by default, as loading is
+usually I/O-bound (e.g. reading from disk or a database), during which
+threads release the GIL and avoid the cost of starting and communicating
+with separate processes. If extracting vectors from the configured
+descriptor set is instead CPU-bound (e.g. heavy deserialization in python),
+set ``parallel.io_bound`` to false to use processes instead.
 """
 
+import functools
+import itertools
 import logging
 import os
 
+import numpy
+
 from smqtk.algorithms.nn_index.lsh.functors.itq import ItqFunctor
 from smqtk.representation import DescriptorSet
+from smqtk.representation.descriptor_set.memory import MemoryDescriptorSet
 from smqtk.utils import (
     cli,
 )
@@ -28,16 +40,79 @@ from smqtk.utils.configuration import (
 __author__ = "paul.tunison@kitware.com"
 
 
+# Number of UUIDs to request from the descriptor set per bulk query.
+UUID_BATCH_SIZE = 1024
+# Read buffer size in bytes used when reading the UUIDs list file.
+UUIDS_FILE_BUFFER = 1 << 20
+
+
+@functools.lru_cache(maxsize=1)
+def _descriptor_set_impls():
+    """
+    Discover DescriptorSet implementations once per process.
+
+    Both ``default_config`` and ``main`` need the set of implementations, and
+    discovery scans the environment, entry-points and loaded sub-classes each
+    time it is invoked.
+
+    :return: Set of discovered DescriptorSet implementation types.
+    :rtype: set[type[smqtk.representation.DescriptorSet]]
+
+    """
+    return DescriptorSet.get_impls()
+
+
+def iter_descriptors_batched(descriptor_set, uuids,
+                             batch_size=UUID_BATCH_SIZE):
+    """
+    Yield descriptors from the given set for the given UUIDs, requesting them
+    via ``get_many_descriptors`` in batches of ``batch_size`` UUIDs.
+
+    :param descriptor_set: Set to get descriptors from.
+    :type descriptor_set: smqtk.representation.DescriptorSet
+
+    :param uuids: Iterable of descriptor UUIDs to get.
+    :type uuids: collections.abc.Iterable[collections.abc.Hashable]
+
+    :param batch_size: Maximum number of UUIDs per bulk query.
+    :type batch_size: int
+
+    :return: Iterator over descriptors in UUID order.
+    :rtype: __generator[smqtk.representation.DescriptorElement]
+
+    """
+    uuids = iter(uuids)
+    batch = list(itertools.islice(uuids, batch_size))
+    while batch:
+        yield from descriptor_set.get_many_descriptors(batch)
+        batch = list(itertools.islice(uuids, batch_size))
+
+
 def default_config():
     return {
         "itq_config": ItqFunctor.get_default_config(),
         "uuids_list_filepath": None,
-        "descriptor_set": make_default_config(DescriptorSet.get_impls()),
+        "descriptor_set": make_default_config(_descriptor_set_impls()),
+        "parallel": {
+            "index_load_cores": None,
+            "io_bound": True,
+        },
     }
 
 
 def cli_parser():
-    return cli.basic_cli_parser(__doc__)
+    parser = cli.basic_cli_parser(__doc__)
+
+    g_io = parser.add_argument_group("I/O")
+    g_io.add_argument("--packed-codes",
+                      default=None, metavar="PATH",
+                      help='Optional path to save the hash codes of the '
+                           'training descriptors to as a numpy file. Codes '
+                           'are packed 8 bits per byte via numpy.packbits, '
+                           'one code per row in the order descriptors were '
+                           'trained on.')
+
+    return parser
 
 
 def main():
@@ -46,6 +121,8 @@ def main():
     log = logging.getLogger(__name__)
 
     uuids_list_filepath = config['uuids_list_filepath']
+    p_index_load_cores = config['parallel']['index_load_cores']
+    p_io_bound = config['parallel']['io_bound']
 
     log.info("Initializing ITQ functor")
     #: :type: smqtk.algorithms.nn_index.lsh.functors.itq.ItqFunctor
@@ -56,23 +133,43 @@ def main():
     #: :type: smqtk.representation.DescriptorSet
     descriptor_set = from_config_dict(
         config['descriptor_set'],
-        DescriptorSet.get_impls(),
+        _descriptor_set_impls(),
     )
 
     if uuids_list_filepath and os.path.isfile(uuids_list_filepath):
         def uuids_iter():
-            with open(uuids_list_filepath) as f:
-                for line in f:
-                    yield line.strip()
-        log.info("Loading UUIDs list from file: %s", uuids_list_filepath)
-        d_iter = descriptor_set.get_many_descriptors(uuids_iter())
+            # Large read buffer for potentially multi-million line files.
+            with open(uuids_list_filepath, buffering=UUIDS_FILE_BUFFER) as f:
+                yield from map(str.strip, f)
+        # A cheap extra pass over the file lets the functor pre-allocate its
+        # descriptor matrix instead of first collecting elements in a list.
+        n = sum(1 for _ in uuids_iter())
+        log.info("Loading UUIDs list from file: %s (count=%d)",
+                 uuids_list_filepath, n)
+        d_iter = iter_descriptors_batched(descriptor_set, uuids_iter())
     else:
-        log.info("Using UUIDs from loaded DescriptorSet (count=%d)",
-                 len(descriptor_set))
+        n = len(descriptor_set)
+        log.info("Using UUIDs from loaded DescriptorSet (count=%d)", n)
         d_iter = descriptor_set
+    if n == 0:
+        raise ValueError("No descriptors to train on.")
+
+    # Threads suffice when loading is I/O-bound. Vectors of an in-memory set
+    # are cheap to extract, so shipping elements to worker processes would
+    # cost more than it saves regardless.
+    use_multiprocessing = not (
+        p_io_bound or isinstance(descriptor_set, MemoryDescriptorSet)
+    )
+
+    log.info("Fitting ITQ model (loading descriptors with %s)",
+             "processes" if use_multiprocessing else "threads")
+    codes = functor.fit(d_iter, use_multiprocessing=use_multiprocessing,
+                        n_hint=n, procs=p_index_load_cores)
 
-    log.info("Fitting ITQ model")
-    functor.fit(d_iter)
+    if args.packed_codes:
+        log.info("Saving packed training hash codes to: %s",
+                 args.packed_codes)
+        numpy.save(args.packed_codes, numpy.packbits(codes, axis=1))
     log.info("Done")
 
 
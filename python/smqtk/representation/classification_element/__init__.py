@@ -1,6 +1,6 @@
 import abc
-
-import six
+import heapq
+import operator
 
 from smqtk.exceptions import NoClassificationError
 from smqtk.representation import SmqtkRepresentation
@@ -10,9 +10,6 @@ from smqtk.utils.plugin import Pluggable
 __author__ = "paul.tunison@kitware.com"
 
 
-NEG_INF = float('-inf')
-
-
 class ClassificationElement(SmqtkRepresentation, Pluggable):
     """
     Classification result encapsulation.
@@ -27,14 +24,32 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
     Element equality based on classification labels and values, not the type or
     UUID.
 
+    Implementing classes must define ``__slots__`` (which may be empty) so that
+    instances do not carry a ``__dict__``. A ``TypeError`` is raised when
+    defining a sub-class that does not.
+
     Since this base class defines ``__getstate__`` and ``__setstate__`` methods
-    implementing classes must also extend these methods to support
-    serialization. These methods have been marked as abstract to facilitate
-    this requirement.
+    implementing classes must also extend these methods, calling the base
+    implementations via ``super``, to support serialization of their own
+    state.
+
+    Implementations may opt in to a per-instance cache of the classification
+    map, used by comparison, ``__getitem__``, ``max_label`` and ``topk``, by
+    setting ``CACHE_CLASSIFICATION`` to True. This is only appropriate when
+    the stored classification cannot be modified other than through the same
+    instance (e.g. in-memory storage). Opted-in implementations should assign
+    the map given to ``set_classification`` to ``self._cls_cache`` after
+    storing it, and reset it to ``None`` in any other method that modifies the
+    stored classification.
 
     """
 
-    __slots__ = ('type_name', 'uuid')
+    __slots__ = ('type_name', 'uuid', '_hash', '_cls_cache')
+
+    # Whether ``_get_cached`` may cache the classification map per instance.
+    # Storage shared between instances or processes (e.g. files, databases)
+    # must leave this False so that external modifications are observed.
+    CACHE_CLASSIFICATION = False
 
     def __init__(self, type_name, uuid):
         """
@@ -51,18 +66,31 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
         super(ClassificationElement, self).__init__()
         self.type_name = type_name
         self.uuid = uuid
+        # Type name and UUID are not expected to change after construction,
+        # so the hash is computed once here instead of on every call.
+        self._hash = hash((type_name, uuid))
+        self._cls_cache = None
+
+    def __init_subclass__(cls, **kwargs):
+        super(ClassificationElement, cls).__init_subclass__(**kwargs)
+        if '__slots__' not in cls.__dict__:
+            raise TypeError("ClassificationElement sub-class '%s' must define "
+                            "__slots__." % cls.__name__)
 
     def __hash__(self):
-        return hash((self.type_name, self.uuid))
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            # Skip potentially expensive classification retrieval.
+            return True
         if isinstance(other, ClassificationElement):
             try:
-                a = self.get_classification()
+                a = self._get_cached()
             except NoClassificationError:
                 a = None
             try:
-                b = other.get_classification()
+                b = other._get_cached()
             except NoClassificationError:
                 b = None
             return a == b
@@ -72,8 +100,8 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
         return not (self == other)
 
     def __repr__(self):
-        return "%s{type_name: %s, uuid: %s}" \
-            % (self.__class__.__name__, self.type_name, self.uuid)
+        return (f"{type(self).__name__}"
+                f"{{type_name: {self.type_name}, uuid: {self.uuid}}}")
 
     def __getitem__(self, label):
         """
@@ -91,9 +119,9 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
         :rtype: float
 
         """
-        return self.get_classification()[label]
+        return self._get_cached()[label]
 
-    def __nonzero__(self):
+    def __bool__(self):
         """
         A ClassificationElement is considered non-zero if
         ``has_classifications`` returns True. See method documentation for
@@ -105,8 +133,6 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
         """
         return self.has_classifications()
 
-    __bool__ = __nonzero__
-
     @classmethod
     def get_default_config(cls):
         """
@@ -183,28 +209,62 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
         :rtype: collections.abc.Hashable
 
         """
-        # Temp (label, confidence) tuple
-        #: :type: (collections.abc.Hashable, float)
-        m = (None, NEG_INF)
-        for i in six.iteritems(self.get_classification()):
-            if i[1] > m[1]:
-                m = i
-        if m[0] is None:
+        d = self._get_cached()
+        if not d:
             raise NoClassificationError("No classifications set to pick the "
                                         "max of.")
-        return m[0]
+        # Key-function form keeps the comparison loop within ``max``.
+        return max(d, key=d.__getitem__)
 
-    #
-    # Abstract methods
-    #
+    def topk(self, k):
+        """
+        Get the ``k`` label-confidence pairs with the highest confidence.
+
+        :param k: Maximum number of pairs to return.
+        :type k: int
+
+        :raises NoClassificationError: No classification set.
+
+        :return: Up to ``k`` label-confidence pairs in descending order of
+            confidence.
+        :rtype: list[(collections.abc.Hashable, float)]
+
+        """
+        return heapq.nlargest(k, self._get_cached().items(),
+                              key=operator.itemgetter(1))
 
-    @abc.abstractmethod
     def __getstate__(self):
         return self.type_name, self.uuid
 
-    @abc.abstractmethod
     def __setstate__(self, state):
         self.type_name, self.uuid = state
+        self._hash = hash((self.type_name, self.uuid))
+        self._cls_cache = None
+
+    def _get_cached(self):
+        """
+        Get the classification map. If ``CACHE_CLASSIFICATION`` is True for
+        this type, ``get_classification`` is only called if the map has not
+        yet been retrieved or set via this instance. Otherwise this is the
+        same as calling ``get_classification``.
+
+        :raises NoClassificationError: No classification labels/confidences yet
+            set.
+
+        :return: Label-to-confidence dictionary.
+        :rtype: dict[collections.abc.Hashable, float]
+
+        """
+        if not self.CACHE_CLASSIFICATION:
+            return self.get_classification()
+        c = self._cls_cache
+        if c is None:
+            c = self._cls_cache = self.get_classification()
+        return c
+
+    #
+    # Abstract methods
+    #
 
     @abc.abstractmethod
     def has_classifications(self):
@@ -245,6 +305,9 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
         NOTE TO IMPLEMENTORS: This abstract method will aggregate input into a
         single dictionary, checks that there is anything in it and return it.
         Thus, a ``super`` call should be made, which will return a dictionary.
+        When only ``m`` is given, that same dictionary instance is returned
+        without copying. When keyword arguments are given, a new dictionary is
+        returned and the input ``m`` is left unmodified.
 
         :param m: New labels-to-confidence mapping to set.
         :type m: dict[collections.abc.Hashable, float]
@@ -254,8 +317,12 @@ class ClassificationElement(SmqtkRepresentation, Pluggable):
         """
         # TODO: Use template method pattern, create ``_set_classification``
         #       abstract method (removing abstract from this).
-        m = m or {}
-        m.update(kwds)
+        if kwds:
+            m = dict(m) if m else {}
+            m.update(kwds)
+        else:
+            # Common case of a single pre-built map: use it as-is.
+            m = m or {}
         if not m:
             raise ValueError("No classification labels/values given.")
         return m
@@ -1,6 +1,5 @@
 import os.path as osp
-
-from six.moves import cPickle
+import pickle
 
 from smqtk.representation.classification_element import ClassificationElement
 
@@ -121,7 +120,7 @@ class FileClassificationElement (ClassificationElement):
         if not self.has_classifications():
             raise NoClassificationError("No classification values.")
         with open(self.filepath, 'rb') as f:
-            return cPickle.load(f)
+            return pickle.load(f)
 
     def set_classification(self, m=None, **kwds):
         """
@@ -141,4 +140,4 @@ class FileClassificationElement (ClassificationElement):
             .set_classification(m, **kwds)
         safe_create_dir(osp.dirname(self.filepath))
         with open(self.filepath, 'wb') as f:
-            cPickle.dump(m, f, self.pickle_protocol)
+            pickle.dump(m, f, self.pickle_protocol)
@@ -15,6 +15,10 @@ class MemoryClassificationElement (ClassificationElement):
 
     __slots__ = ('_c', '_c_lock')
 
+    # Storage is local to the instance, so the classification map is safe to
+    # cache.
+    CACHE_CLASSIFICATION = True
+
     @classmethod
     def is_usable(cls):
         # No external dependencies
@@ -116,3 +120,4 @@ class MemoryClassificationElement (ClassificationElement):
             .set_classification(m, **kwds)
         with self._c_lock:
             self._c = m
+            self._cls_cache = m
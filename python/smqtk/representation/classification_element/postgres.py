@@ -1,4 +1,4 @@
-from six.moves import cPickle
+import pickle
 
 from smqtk.exceptions import NoClassificationError
 from smqtk.representation import ClassificationElement
@@ -283,7 +283,7 @@ class PostgresClassificationElement (ClassificationElement):
                                             % (self.type_name, str(self.uuid)))
             else:
                 b = r[0]
-                c = cPickle.loads(b)
+                c = pickle.loads(b)
                 return c
         except Exception:
             conn.rollback()
@@ -317,7 +317,7 @@ class PostgresClassificationElement (ClassificationElement):
         })
         q_upsert_values = {
             "classification_val":
-                psycopg2.Binary(cPickle.dumps(m, self.pickle_protocol)),
+                psycopg2.Binary(pickle.dumps(m, self.pickle_protocol)),
             "type_val": self.type_name,
             "uuid_val": str(self.uuid),
         }
@@ -157,7 +157,7 @@ class FeatureMemory (object):
         """
         Calculates distance between two vectors using histogram intersection.
 
-        Non-branching version of the histogram intersection algorithm.
+        Computed as the sum of the element-wise minimum of the inputs.
 
         :param a: A vector in array form.
         :type a: ndarray
@@ -168,8 +168,7 @@ class FeatureMemory (object):
         :rtype: double
 
         """
-        # noinspection PyUnresolvedReferences
-        return (a + b - np.abs(a - b)).sum() * 0.5
+        return np.minimum(a, b).sum()
 
     def get_ids(self):
         """
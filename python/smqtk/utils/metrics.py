@@ -11,6 +11,19 @@ from math import acos, pi
 import numpy as np
 
 
+def _accumulation_dtype(a, b):
+    """
+    Get the type distance sums over arrays ``a`` and ``b`` should accumulate
+    in. Inputs narrower than single precision (e.g. half-precision, halving
+    memory traffic) are summed in at least single precision. Otherwise None is
+    returned, leaving numpy's default, which avoids the cost of type promotion
+    on every call of the per-pair functions.
+    """
+    if a.dtype.itemsize < 4 or b.dtype.itemsize < 4:
+        return np.result_type(np.float32, a.dtype, b.dtype)
+    return None
+
+
 def histogram_intersection_distance(a, b):
     """
     Compute the histogram intersection distance between given histogram
@@ -18,7 +31,7 @@ def histogram_intersection_distance(a, b):
     ``1.0``. This is the inverse of intersection similarity, whereby a distance
     of  ``0.0`` means full intersection and ``1.0`` means no intersection.
 
-    This implements non-branching formula for efficient computation.
+    This is computed as the sum of the element-wise minimum of the inputs.
 
     Input vectors ``a`` and ``b`` may be of 1 or 2 dimensions. Depending on the
     values of ``a`` and ``b``, different things may occur:
@@ -52,9 +65,12 @@ def histogram_intersection_distance(a, b):
     sum_axis = 1
     if a.ndim == 1 and b.ndim == 1:
         sum_axis = 0
-    # TODO(john.moeller): Assuming each sums to 1, this can be sped up
-    #   return np.abs(np.subtract(i, j)).sum(sum_axis) * 0.5
-    return 1. - ((np.add(a, b) - np.abs(np.subtract(a, b))).sum(sum_axis) * 0.5)
+    # ``(a + b - |a - b|) / 2`` is the element-wise minimum, computed here
+    # directly instead of via three intermediate arrays.
+    acc_dtype = _accumulation_dtype(a, b)
+    if acc_dtype is None:
+        return 1. - np.minimum(a, b).sum(sum_axis)
+    return 1. - np.minimum(a, b).sum(sum_axis, dtype=acc_dtype)
 
 
 def histogram_intersection_distance_fast(i, j):
@@ -63,7 +79,7 @@ def histogram_intersection_distance_fast(i, j):
     histogram vectors ``a`` and ``b``, returning a value between 0.0 and 1.0.
     0.0 means full intersection, and 1.0 means no intersection.
 
-    This implements non-branching formula for efficient computation.
+    This is computed as the sum of the element-wise minimum of the inputs.
 
     Use of this implementations is faster when the input will only be 1D
     vectors.
@@ -82,13 +98,20 @@ def histogram_intersection_distance_fast(i, j):
     :rtype: float
 
     """
-    return 1.0 - ((i + j - np.abs(i - j)).sum() * 0.5)
+    acc_dtype = _accumulation_dtype(i, j)
+    if acc_dtype is None:
+        return 1.0 - np.minimum(i, j).sum()
+    return 1.0 - np.minimum(i, j).sum(dtype=acc_dtype)
 
 
 def euclidean_distance(i, j):
     """
     Compute euclidean distance between two N-dimensional point vectors.
 
+    Either input may instead be a 2D matrix, in which case a vector of
+    distances between parallel rows (or between the 1D vector and each row of
+    the matrix) is returned.
+
     :param i: Vector i
     :type i: np.ndarray
 
@@ -99,11 +122,16 @@ def euclidean_distance(i, j):
     :rtype: float | np.ndarray
 
     """
-    sum_axis = 1
-    if i.ndim == 1 and j.ndim == 1:
-        sum_axis = 0
-    # noinspection PyTypeChecker
-    return np.sqrt(np.square(i - j).sum(sum_axis))
+    d = np.subtract(i, j)
+    acc_dtype = _accumulation_dtype(i, j)
+    if d.ndim == 1:
+        # Cheapest for a single pair of vectors, the common per-pair case.
+        if acc_dtype is None:
+            return np.sqrt(np.square(d).sum())
+        return np.sqrt(np.square(d, dtype=acc_dtype).sum())
+    # Row-wise dot product of the difference with itself squares and sums in
+    # one pass, without materializing a separate squared-difference array.
+    return np.sqrt(np.einsum('...i,...i->...', d, d, dtype=acc_dtype))
 
 
 def cosine_similarity(i, j):
@@ -180,3 +208,31 @@ def hamming_distance(i, j):
     """
     # TODO: Find something better than this?
     return bin(i ^ j).count('1')
+
+
+# Number of set bits for every possible byte value.
+_BYTE_POPCOUNT = np.unpackbits(
+    np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1
+).sum(1).astype(np.uint8)
+
+
+def hamming_distance_packed(i, j):
+    """
+    Return the hamming distance between bit vectors packed into ``uint8``
+    arrays, e.g. via ``numpy.packbits``.
+
+    Either input may be a 2D matrix of packed vectors (one per row), in which
+    case a vector of distances is returned, following the same broadcasting
+    rules as ``euclidean_distance``.
+
+    :param i: Packed bit vector(s) i.
+    :type i: numpy.ndarray[numpy.uint8]
+
+    :param j: Packed bit vector(s) j.
+    :type j: numpy.ndarray[numpy.uint8]
+
+    :return: Integer hamming distance(s).
+    :rtype: int | numpy.ndarray[int]
+
+    """
+    return _BYTE_POPCOUNT[np.bitwise_xor(i, j)].sum(-1, dtype=np.intp)
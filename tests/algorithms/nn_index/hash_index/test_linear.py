@@ -155,6 +155,52 @@ class TestLinearHashIndex (unittest.TestCase):
         numpy.testing.assert_array_almost_equal(near_dists,
                                                 (1/3., 1/3., 2/3., 2/3.))
 
+    def test_nn_after_index_change(self):
+        # Results should reflect the index after it is updated or reassigned.
+        i = LinearHashIndex()
+        # noinspection PyTypeChecker
+        i.build_index([[1, 1, 1]])
+        # noinspection PyTypeChecker
+        near_codes, near_dists = i.nn([0, 0, 0], 1)
+        self.assertEqual(tuple(near_codes[0]), (1, 1, 1))
+
+        # noinspection PyTypeChecker
+        i.update_index([[0, 0, 1]])
+        # noinspection PyTypeChecker
+        near_codes, near_dists = i.nn([0, 0, 0], 1)
+        self.assertEqual(tuple(near_codes[0]), (0, 0, 1))
+
+        i.index = {0b011}
+        # noinspection PyTypeChecker
+        near_codes, near_dists = i.nn([0, 0, 0], 1)
+        self.assertEqual(tuple(near_codes[0]), (0, 1, 1))
+        numpy.testing.assert_array_almost_equal(near_dists, (2/3.,))
+
+    def test_update_index_in_place(self):
+        # Updating should add to the existing index set rather than copying.
+        i = LinearHashIndex()
+        # noinspection PyTypeChecker
+        i.build_index([[0, 1, 0]])
+        index_set = i.index
+        # noinspection PyTypeChecker
+        i.update_index([[1, 1, 0]])
+        self.assertIs(i.index, index_set)
+        self.assertSetEqual(i.index, {0b010, 0b110})
+
+    def test_nn_loaded_cache(self):
+        # Codes loaded from a cache are numpy integers.
+        cache_element = DataMemoryElement()
+        i1 = LinearHashIndex(cache_element)
+        # noinspection PyTypeChecker
+        i1.build_index([[0, 1, 0],
+                        [1, 1, 0]])
+        i2 = LinearHashIndex(cache_element)
+        # noinspection PyTypeChecker
+        near_codes, near_dists = i2.nn([0, 0, 0], 2)
+        self.assertEqual(list(map(tuple, near_codes)),
+                         [(0, 1, 0), (1, 1, 0)])
+        numpy.testing.assert_array_almost_equal(near_dists, (1/3., 2/3.))
+
     def test_save_cache_build_index(self):
         cache_element = DataMemoryElement()
         self.assertTrue(cache_element.is_empty())
@@ -300,6 +300,103 @@ class TestItqFunctor (unittest.TestCase):
              [1 / sqrt(2)]]
         )
 
+    def test_fit_iterable_n_hint(self):
+        # Fitting on an iterable with an accurate, low or high count hint
+        # should produce the same model as fitting on the full sequence.
+        fit_descriptors = []
+        for i in range(5):
+            d = DescriptorMemoryElement(six.b('test'), i)
+            d.set_vector([-2. + i, -2. + i])
+            fit_descriptors.append(d)
+
+        for n_hint in (5, 7):
+            itq = ItqFunctor(bit_length=1, random_seed=0)
+            itq.fit(iter(fit_descriptors), n_hint=n_hint)
+            numpy.testing.assert_array_almost_equal(itq.mean_vec, [0, 0])
+            numpy.testing.assert_array_almost_equal(
+                itq.rotation, [[1 / sqrt(2)], [1 / sqrt(2)]]
+            )
+
+        # A hint lower than the number of descriptors only uses that many.
+        itq = ItqFunctor(bit_length=1, random_seed=0)
+        itq.fit(iter(fit_descriptors), n_hint=3)
+        numpy.testing.assert_array_almost_equal(itq.mean_vec, [-1, -1])
+
+        # Explicit worker count for collecting vectors.
+        itq = ItqFunctor(bit_length=1, random_seed=0)
+        itq.fit(iter(fit_descriptors), n_hint=5, procs=1)
+        numpy.testing.assert_array_almost_equal(itq.mean_vec, [0, 0])
+
+    def test_fit_iterable_n_hint_invalid(self):
+        # Empty iterables and non-positive hints should be rejected up front.
+        itq = ItqFunctor(bit_length=1)
+        self.assertRaisesRegex(
+            ValueError,
+            "No descriptors given to fit on",
+            itq.fit, iter([]), n_hint=3
+        )
+        for n_hint in (0, -1):
+            self.assertRaisesRegex(
+                ValueError,
+                "Descriptor count hint must be at least 1",
+                itq.fit, iter([]), n_hint=n_hint
+            )
+        self.assertIsNone(itq.mean_vec)
+        self.assertIsNone(itq.rotation)
+
+    def test_fit_matrix(self):
+        # Fitting on a matrix of descriptor vectors should produce the same
+        # model as fitting on the equivalent descriptor elements.
+        x = numpy.array([[-2. + i, -2. + i] for i in range(5)])
+
+        itq = ItqFunctor(bit_length=1, random_seed=0)
+        itq.fit(x)
+        numpy.testing.assert_array_almost_equal(itq.mean_vec, [0, 0])
+        numpy.testing.assert_array_almost_equal(itq.rotation, [[1 / sqrt(2)],
+                                                               [1 / sqrt(2)]])
+
+    def test_fit_matrix_not_modified(self):
+        # The given matrix should not be modified, e.g. by centering.
+        x = numpy.array([[-1. + i, -1. + i] for i in range(5)])
+        x_orig = x.copy()
+        itq = ItqFunctor(bit_length=1, random_seed=0)
+        itq.fit(x)
+        numpy.testing.assert_array_equal(x, x_orig)
+        numpy.testing.assert_array_almost_equal(itq.mean_vec, [1, 1])
+
+    def test_fit_matrix_integer(self):
+        # Integer matrices should be fit the same as their float equivalent.
+        x = numpy.array([[-2 + i, -2 + i] for i in range(5)])
+        itq = ItqFunctor(bit_length=1, random_seed=0)
+        itq.fit(x)
+        numpy.testing.assert_array_equal(x, [[-2 + i, -2 + i]
+                                             for i in range(5)])
+        numpy.testing.assert_array_almost_equal(itq.mean_vec, [0, 0])
+        numpy.testing.assert_array_almost_equal(itq.rotation, [[1 / sqrt(2)],
+                                                               [1 / sqrt(2)]])
+
+    def test_fit_matrix_invalid(self):
+        # Input matrices must be 2D and have at least bit-length features.
+        itq = ItqFunctor(bit_length=1)
+        self.assertRaisesRegex(
+            ValueError,
+            "Descriptor matrix must be 2-dimensional",
+            itq.fit, numpy.zeros(5)
+        )
+        self.assertRaisesRegex(
+            ValueError,
+            "No descriptors given to fit on",
+            itq.fit, numpy.zeros((0, 2))
+        )
+        itq = ItqFunctor(bit_length=8)
+        self.assertRaisesRegex(
+            ValueError,
+            "Input descriptors have fewer features than requested bit encoding",
+            itq.fit, numpy.zeros((5, 2))
+        )
+        self.assertIsNone(itq.mean_vec)
+        self.assertIsNone(itq.rotation)
+
     def test_get_hash(self):
         fit_descriptors = []
         for i in range(5):
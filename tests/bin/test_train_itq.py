@@ -0,0 +1,194 @@
+import json
+import unittest
+import unittest.mock as mock
+
+import numpy
+import pytest
+
+from smqtk.algorithms.nn_index.lsh.functors.itq import ItqFunctor
+from smqtk.bin.train_itq import (
+    default_config,
+    iter_descriptors_batched,
+    main,
+)
+from smqtk.representation.descriptor_element.local_elements import \
+    DescriptorMemoryElement
+from smqtk.representation import DescriptorSet
+from smqtk.representation.data_element.file_element import DataFileElement
+from smqtk.representation.descriptor_set.memory import MemoryDescriptorSet
+
+
+class TestIterDescriptorsBatched (unittest.TestCase):
+
+    def setUp(self):
+        self.d_set = MemoryDescriptorSet()
+        for i in range(5):
+            d = DescriptorMemoryElement('test', i)
+            d.set_vector([i, i])
+            self.d_set.add_descriptor(d)
+
+    def test_batches(self):
+        # Descriptors should be yielded in the order of the given UUIDs,
+        # requested in bounded batches.
+        uuids = [3, 1, 4, 0, 2]
+        with mock.patch.object(
+                self.d_set, 'get_many_descriptors',
+                wraps=self.d_set.get_many_descriptors) as m_get_many:
+            ds = list(iter_descriptors_batched(self.d_set, iter(uuids),
+                                               batch_size=2))
+        assert [d.uuid() for d in ds] == uuids
+        assert m_get_many.call_args_list == [
+            mock.call([3, 1]), mock.call([4, 0]), mock.call([2]),
+        ]
+
+    def test_no_uuids(self):
+        # No UUIDs should not query the descriptor set at all.
+        with mock.patch.object(self.d_set,
+                               'get_many_descriptors') as m_get_many:
+            assert list(iter_descriptors_batched(self.d_set, [])) == []
+        m_get_many.assert_not_called()
+
+
+def test_default_config_parallel():
+    """
+    Test that descriptor loading defaults to the I/O-bound (threaded) mode.
+    """
+    c = default_config()
+    assert c['parallel'] == {"index_load_cores": None, "io_bound": True}
+
+
+def _run_main(tmp_path, config, *argv):
+    """
+    Run ``main`` with the given configuration, which is merged onto the
+    default configuration, and additional command line arguments.
+    """
+    config_fp = str(tmp_path / 'config.json')
+    with open(config_fp, 'w') as f:
+        json.dump(config, f)
+    with mock.patch('sys.argv', ['train_itq', '-c', config_fp] + list(argv)):
+        main()
+
+
+def _memory_set_config(cache_fp=None):
+    """
+    Get a MemoryDescriptorSet configuration, optionally cached to the given
+    file path.
+    """
+    t_set = "smqtk.representation.descriptor_set.memory.MemoryDescriptorSet"
+    t_file = "smqtk.representation.data_element.file_element.DataFileElement"
+    cache_config = {"type": None}
+    if cache_fp:
+        cache_config = {"type": t_file, t_file: {"filepath": cache_fp}}
+    return {"type": t_set, t_set: {"cache_element": cache_config}}
+
+
+def test_main_no_descriptors(tmp_path):
+    """
+    Test that an empty descriptor set fails before fitting with a clear
+    error.
+    """
+    with pytest.raises(ValueError, match=r"No descriptors to train on\."):
+        _run_main(tmp_path, {"descriptor_set": _memory_set_config()})
+
+
+def test_main_empty_uuids_list(tmp_path):
+    """
+    Test that an empty UUIDs list file fails before fitting with a clear
+    error.
+    """
+    uuids_fp = tmp_path / 'uuids.txt'
+    uuids_fp.write_text('')
+    with pytest.raises(ValueError, match=r"No descriptors to train on\."):
+        _run_main(tmp_path, {"descriptor_set": _memory_set_config(),
+                             "uuids_list_filepath": str(uuids_fp)})
+
+
+def _make_cached_memory_set(cache_fp, n=10, dim=8):
+    """
+    Create a MemoryDescriptorSet cache file with ``n`` random descriptors of
+    ``dim`` features.
+    """
+    rng = numpy.random.RandomState(0)
+    d_set = MemoryDescriptorSet(DataFileElement(cache_fp))
+    ds = []
+    for i in range(n):
+        d = DescriptorMemoryElement('test', i)
+        d.set_vector(rng.rand(dim))
+        ds.append(d)
+    d_set.add_many_descriptors(ds)
+
+
+def test_main_packed_codes(tmp_path):
+    """
+    Test that the saved packed codes unpack to the codes of the training
+    descriptors from fitting.
+    """
+    cache_fp = str(tmp_path / 'set.pickle')
+    _make_cached_memory_set(cache_fp)
+    packed_fp = str(tmp_path / 'codes.npy')
+
+    fit_codes = []
+    itq_fit = ItqFunctor.fit
+
+    def fit(self, *args, **kwds):
+        c = itq_fit(self, *args, **kwds)
+        fit_codes.append(c)
+        return c
+
+    # Bit length that is not a multiple of 8 to check for padding bits.
+    config = {
+        "descriptor_set": _memory_set_config(cache_fp),
+        "itq_config": {"bit_length": 4, "random_seed": 0},
+    }
+    with mock.patch.object(ItqFunctor, 'fit', fit):
+        _run_main(tmp_path, config, '--packed-codes', packed_fp)
+
+    assert len(fit_codes) == 1
+    codes = fit_codes[0]
+    assert codes.shape == (10, 4)
+    packed = numpy.load(packed_fp)
+    assert packed.dtype == numpy.uint8
+    assert packed.shape == (10, 1)
+    numpy.testing.assert_array_equal(
+        numpy.unpackbits(packed, axis=1)[:, :4].astype(bool), codes
+    )
+
+
+@pytest.mark.parametrize('io_bound, expected_use_mp', [
+    (True, False),
+    (False, True),
+])
+def test_main_parallel_non_memory_set(tmp_path, io_bound, expected_use_mp):
+    """
+    Test that descriptors of a set that is not in memory are loaded with
+    threads when I/O-bound and with processes otherwise, using the
+    configured number of cores.
+    """
+    m_set = mock.MagicMock(spec=DescriptorSet)
+    m_set.__len__.return_value = 3
+    config = {"parallel": {"io_bound": io_bound, "index_load_cores": 2}}
+    with mock.patch('smqtk.bin.train_itq.from_config_dict',
+                    return_value=m_set), \
+            mock.patch.object(ItqFunctor, 'fit') as m_fit:
+        _run_main(tmp_path, config)
+    m_fit.assert_called_once_with(m_set, use_multiprocessing=expected_use_mp,
+                                  n_hint=3, procs=2)
+
+
+@pytest.mark.parametrize('io_bound', [True, False])
+def test_main_parallel_memory_set(tmp_path, io_bound):
+    """
+    Test that descriptors of a MemoryDescriptorSet are always loaded with
+    threads.
+    """
+    cache_fp = str(tmp_path / 'set.pickle')
+    _make_cached_memory_set(cache_fp)
+    config = {
+        "descriptor_set": _memory_set_config(cache_fp),
+        "parallel": {"io_bound": io_bound, "index_load_cores": None},
+    }
+    with mock.patch.object(ItqFunctor, 'fit') as m_fit:
+        _run_main(tmp_path, config)
+    m_fit.assert_called_once()
+    _, kwds = m_fit.call_args
+    assert kwds == {"use_multiprocessing": False, "n_hint": 10, "procs": None}
@@ -12,6 +12,9 @@ from smqtk.representation import ClassificationElement
 
 class DummyCEImpl (ClassificationElement):
 
+    # Keep a ``__dict__`` so tests may mock methods on instances.
+    __slots__ = ('__dict__',)
+
     @classmethod
     def is_usable(cls):
         # Required to be True to construct.
@@ -45,10 +48,31 @@ class TestClassificationElementAbstract (unittest.TestCase):
         self.assertEqual(e.type_name, 'foo')
         self.assertEqual(e.uuid, 'bar')
 
+    def test_subclass_requires_slots(self):
+        """
+        Test that defining a sub-class without ``__slots__`` raises a
+        TypeError.
+        """
+        with pytest.raises(TypeError, match=r"must define __slots__"):
+            class NoSlotsCEImpl (DummyCEImpl):
+                pass
+
+    def test_repr(self):
+        assert repr(DummyCEImpl('foo', 'bar')) == \
+            "DummyCEImpl{type_name: foo, uuid: bar}"
+
     def test_hash(self):
         self.assertEqual(hash(DummyCEImpl('foo', 'bar')),
                          hash(('foo', 'bar')))
 
+    def test_hash_after_deserialize(self):
+        """
+        Test that the cached hash value is restored when unpickling.
+        """
+        inst1 = DummyCEImpl('foo', 'bar')
+        inst2 = pickle.loads(pickle.dumps(inst1))
+        assert hash(inst2) == hash(inst1) == hash(('foo', 'bar'))
+
     def test_equality(self):
         """
         Test that two classification elements that return the same non-empty
@@ -68,6 +92,18 @@ class TestClassificationElementAbstract (unittest.TestCase):
         assert inst1 == inst2
         assert not (inst1 != inst2)  # lgtm[py/redundant-comparison]
 
+    def test_equality_same_instance(self):
+        """
+        Test that an element is equal to itself without retrieving its
+        classification map.
+        """
+        # noinspection PyTypeChecker
+        inst1 = DummyCEImpl(None, None)
+        inst1.get_classification = mock.Mock(side_effect=NoClassificationError)
+
+        assert inst1 == inst1  # lgtm[py/comparison-of-identical-expressions]
+        inst1.get_classification.assert_not_called()
+
     def test_equality_other_not_element(self):
         """
         Test that equality fails when other value is not a
@@ -213,7 +249,7 @@ class TestClassificationElementAbstract (unittest.TestCase):
         """
         # Mock classification element instance
         e = mock.MagicMock(spec_set=ClassificationElement)
-        e.get_classification.return_value = {}
+        e._get_cached.return_value = {}
 
         self.assertRaises(
             NoClassificationError,
@@ -227,9 +263,71 @@ class TestClassificationElementAbstract (unittest.TestCase):
         """
         # Mock classification element instance
         e = mock.MagicMock(spec_set=ClassificationElement)
-        e.get_classification.return_value = {'a': 0.0}
+        e._get_cached.return_value = {'a': 0.0}
         ClassificationElement.max_label(e)
 
+    def test_topk(self):
+        """
+        Test that topk returns the k highest confidence label-confidence
+        pairs in descending confidence order.
+        """
+        # Mock classification element instance
+        e = mock.MagicMock(spec_set=ClassificationElement)
+        e._get_cached.return_value = {1: 0.1, 2: 0.4, 3: 0.3, 4: 0.2}
+
+        assert ClassificationElement.topk(e, 2) == [(2, 0.4), (3, 0.3)]
+        assert ClassificationElement.topk(e, 10) == [
+            (2, 0.4), (3, 0.3), (4, 0.2), (1, 0.1)
+        ]
+        assert ClassificationElement.topk(e, 0) == []
+
+    def test_get_cached(self):
+        """
+        Test that, when opted in to, the classification map is only retrieved
+        via ``get_classification`` once and is then served from the cache.
+        """
+        # Mock classification element instance
+        e = mock.MagicMock(spec_set=ClassificationElement)
+        e.CACHE_CLASSIFICATION = True
+        e._cls_cache = None
+        e.get_classification.return_value = {'a': 1.0}
+
+        assert ClassificationElement._get_cached(e) == {'a': 1.0}
+        assert ClassificationElement._get_cached(e) == {'a': 1.0}
+        e.get_classification.assert_called_once_with()
+
+    def test_get_cached_not_opted_in(self):
+        """
+        Test that the classification map is not cached by default.
+        """
+        assert ClassificationElement.CACHE_CLASSIFICATION is False
+        # Mock classification element instance
+        e = mock.MagicMock(spec_set=ClassificationElement)
+        e.CACHE_CLASSIFICATION = False
+        e._cls_cache = None
+        e.get_classification.return_value = {'a': 1.0}
+
+        assert ClassificationElement._get_cached(e) == {'a': 1.0}
+        assert ClassificationElement._get_cached(e) == {'a': 1.0}
+        assert e.get_classification.call_count == 2
+        assert e._cls_cache is None
+
+    def test_get_cached_no_classification_error(self):
+        """
+        Test that a failed retrieval is not cached.
+        """
+        # Mock classification element instance
+        e = mock.MagicMock(spec_set=ClassificationElement)
+        e.CACHE_CLASSIFICATION = True
+        e._cls_cache = None
+        e.get_classification.side_effect = NoClassificationError
+
+        self.assertRaises(
+            NoClassificationError,
+            ClassificationElement._get_cached, e
+        )
+        assert e._cls_cache is None
+
     def test_get_default_config(self):
         """
         Test that the default configuration does not include the runtime
@@ -353,7 +451,7 @@ class TestClassificationElementAbstract (unittest.TestCase):
         # Mock classification element instance
         #: :type: ClassificationElement
         e = mock.MagicMock(spec_set=ClassificationElement)
-        e.get_classification.return_value = {1: 0, 2: 1, 3: 0.5}
+        e._get_cached.return_value = {1: 0, 2: 1, 3: 0.5}
 
         expected_label = 2
         actual_label = ClassificationElement.max_label(e)
@@ -443,3 +541,29 @@ class TestClassificationElementAbstract (unittest.TestCase):
         actual_v = ClassificationElement.set_classification(e, {'a': 1, 1: 1},
                                                             b=1, d=1)
         assert actual_v == expected_v
+
+    def test_set_input_dict_not_copied(self):
+        """
+        Test that passing only a dictionary to ``set_classification`` returns
+        that same dictionary instance.
+        """
+        # Mock element instance
+        #: :type: ClassificationElement
+        e = mock.MagicMock(spec_set=ClassificationElement)
+
+        v = {1: 0, 2: 1}
+        assert ClassificationElement.set_classification(e, v) is v
+
+    def test_set_mixed_input_not_modified(self):
+        """
+        Test that passing a dictionary along with keyword arguments does not
+        modify the input dictionary.
+        """
+        # Mock element instance
+        #: :type: ClassificationElement
+        e = mock.MagicMock(spec_set=ClassificationElement)
+
+        v = {'a': .5}
+        actual_v = ClassificationElement.set_classification(e, v, b=.5)
+        assert actual_v == {'a': .5, 'b': .5}
+        assert v == {'a': .5}
@@ -177,3 +177,19 @@ def test_has_classification_no_file(m_os_isfile):
 
     assert e.has_classifications() is False
     m_os_isfile.assert_called_once_with(expected_fp)
+
+
+def test_classification_not_cached(tmp_path):
+    """
+    Test that classification maps are not cached per instance, so a map
+    rewritten through another instance is observed consistently.
+    """
+    e1 = FileClassificationElement('test', 0, str(tmp_path))
+    e2 = FileClassificationElement('test', 0, str(tmp_path))
+    e1.set_classification(a=1.0, b=0.0)
+    assert e2.max_label() == 'a'
+
+    e1.set_classification(b=1.0)
+    assert e2.max_label() == 'b'
+    assert e2['b'] == 1.0
+    assert e2 == e1
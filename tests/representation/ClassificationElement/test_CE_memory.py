@@ -1,9 +1,9 @@
+import pickle
 import threading
 import unittest
 import unittest.mock as mock
 
 import pytest
-from six.moves import cPickle
 
 from smqtk.exceptions import NoClassificationError
 from smqtk.representation.classification_element.memory \
@@ -36,6 +36,12 @@ class TestMemoryClassificationElement (unittest.TestCase):
         # in python 2, threading.RLock() is threading._RLock, but in 3 its _thread.RLock
         assert isinstance(m._c_lock, type(threading.RLock()))
 
+    def test_no_instance_dict(self):
+        """
+        Test that instances are fully slotted and carry no ``__dict__``.
+        """
+        assert not hasattr(MemoryClassificationElement('a', 'b'), '__dict__')
+
     def test_configuration(self):
         """
         Test standard configuration
@@ -52,7 +58,7 @@ class TestMemoryClassificationElement (unittest.TestCase):
 
         expected_map = None
         assert e._c == expected_map
-        e2 = cPickle.loads(cPickle.dumps(e))
+        e2 = pickle.loads(pickle.dumps(e))
         assert e2._c == expected_map
 
     def test_serialization_nonempty(self):
@@ -61,7 +67,7 @@ class TestMemoryClassificationElement (unittest.TestCase):
 
         expected_map = {'a': 0, 'b': 1}
         assert e._c == expected_map
-        e2 = cPickle.loads(cPickle.dumps(e))
+        e2 = pickle.loads(pickle.dumps(e))
         assert e2._c == expected_map
 
     def test_get_config_empty(self):
@@ -128,3 +134,17 @@ class TestMemoryClassificationElement (unittest.TestCase):
         expected_map = {'a': 1, 'b': 0}
         e.set_classification(expected_map)
         assert e._c == expected_map
+
+    def test_set_classification_cached(self):
+        """
+        Test that a classification map set on an element is then served from
+        that element's cache.
+        """
+        e = MemoryClassificationElement('test', 0)
+        e.set_classification(a=1.0, b=0.0)
+
+        with mock.patch.object(MemoryClassificationElement,
+                               'get_classification') as m_get:
+            assert e.max_label() == 'a'
+            assert e['b'] == 0.0
+        m_get.assert_not_called()
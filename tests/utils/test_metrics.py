@@ -83,6 +83,59 @@ class TestHistogramIntersectionDistance (unittest.TestCase):
                           self.m1, self.m2)
 
 
+class TestEuclideanDistance (unittest.TestCase):
+
+    v1 = np.array([0., 0.])
+    v2 = np.array([3., 4.])
+    m1 = np.array([[0., 0.], [3., 4.], [6., 8.]])
+
+    def test_vectors(self):
+        self.assertEqual(df.euclidean_distance(self.v1, self.v1), 0.)
+        self.assertEqual(df.euclidean_distance(self.v1, self.v2), 5.)
+        self.assertEqual(df.euclidean_distance(self.v2, self.v1), 5.)
+
+    def test_vector_matrix(self):
+        np.testing.assert_array_equal(
+            df.euclidean_distance(self.v2, self.m1),
+            [5., 0., 5.]
+        )
+        np.testing.assert_array_equal(
+            df.euclidean_distance(self.m1, self.v1),
+            [0., 5., 10.]
+        )
+
+    def test_matrix_matrix(self):
+        np.testing.assert_array_equal(
+            df.euclidean_distance(self.m1, self.m1[::-1]),
+            [10., 0., 10.]
+        )
+
+
+class TestHalfPrecisionAccumulation (unittest.TestCase):
+    """
+    Half-precision inputs should be reduced in at least single precision.
+    """
+
+    # 4096 * 1e-3 is not representable by accumulating in float16.
+    v1 = np.full(4096, 1e-3, dtype=np.float16)
+    v2 = np.zeros(4096, dtype=np.float16)
+
+    def test_euclidean(self):
+        d = df.euclidean_distance(self.v1, self.v2)
+        self.assertEqual(d.dtype, np.float32)
+        np.testing.assert_allclose(
+            d, np.sqrt(4096 * float(self.v1[0]) ** 2), rtol=1e-4
+        )
+
+    def test_hi(self):
+        for f in (df.histogram_intersection_distance,
+                  df.histogram_intersection_distance_fast):
+            d = f(self.v1, self.v1)
+            np.testing.assert_allclose(
+                d, 1. - 4096 * float(self.v1[0]), rtol=1e-4
+            )
+
+
 class TestHammingDistance (unittest.TestCase):
 
     def test_hd_0(self):
@@ -103,3 +156,26 @@ class TestHammingDistance (unittest.TestCase):
             b = gen(n)
             actual = bin(a ^ b).count('1')
             self.assertEqual(df.hamming_distance(a, b), actual)
+
+
+class TestHammingDistancePacked (unittest.TestCase):
+
+    def test_matches_int_hamming(self):
+        n = 128
+        for i in range(100):
+            a = gen(n)
+            b = gen(n)
+            a_p = np.frombuffer(a.to_bytes(n // 8, 'big'), dtype=np.uint8)
+            b_p = np.frombuffer(b.to_bytes(n // 8, 'big'), dtype=np.uint8)
+            self.assertEqual(df.hamming_distance_packed(a_p, b_p),
+                             df.hamming_distance(a, b))
+
+    def test_vector_matrix(self):
+        bits = np.array([[0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+                         [1, 0, 0, 0, 0, 0, 0, 0, 0, 1],
+                         [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]], dtype=bool)
+        m = np.packbits(bits, axis=1)
+        np.testing.assert_array_equal(
+            df.hamming_distance_packed(m[0], m),
+            [0, 2, 10]
+        )